@@ -5,7 +5,8 @@ from siliconcompiler.flows import dvflow
 import os
 
 
-def main():
+def main(n=1):
+    # n independent simulations run concurrently as parallel sim indices
     root = os.path.dirname(__file__)
     chip = siliconcompiler.Chip('heartbeat')  # create chip object
     chip.input(f'{root}/heartbeat.v')                 # define list of source files
@@ -13,11 +14,11 @@ def main():
 
     chip.set('option', 'mode', 'sim')
     flowname = 'heartbeat_sim'
-    chip.use(dvflow, flowname=flowname)
+    chip.use(dvflow, flowname=flowname, np=n)
     chip.set('option', 'flow', flowname)
 
     chip.run()                                # run compilation
-    chip.summary()                            # print results summary
+    chip.summary(show_all_indices=n > 1)      # print results summary
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import collections
 import pandas
 import os
 from siliconcompiler import Schema
@@ -20,13 +21,14 @@ def make_metric_dataframe(chip):
         Returns pandas dataframe of tracked metrics.
     '''
     nodes, errors, metrics, metrics_unit, metrics_to_show, reports = utils._collect_data(chip)
-    # converts from 2d dictionary to pandas DataFrame, transposes so
-    # orientation is correct, and filters based on the metrics we track
-    data = (pandas.DataFrame.from_dict(metrics, orient='index').transpose())
-    data = data.loc[metrics_to_show]
-    # include metrics_unit
-    data.index = data.index.map(lambda x: (x, metrics_unit[x]))
-    return data
+    # builds the rows directly in display orientation, only for the metrics
+    # we track, so no transpose or filtering is needed afterwards
+    rows = [[metrics[node][metric] for node in nodes] for metric in metrics_to_show]
+    row_index = pandas.MultiIndex.from_tuples(
+        [(metric, metrics_unit[metric]) for metric in metrics_to_show],
+        names=[None, None])
+    column_index = pandas.MultiIndex.from_tuples(nodes, names=[None, None])
+    return pandas.DataFrame(rows, index=row_index, columns=column_index)
 
 
 def get_flowgraph_nodes(chip, step, index):
@@ -76,11 +78,10 @@ def get_flowgraph_edges(chip):
     '''
     flowgraph_edges = {}
     flow = chip.get('option', 'flow')
-    for step in chip.getkeys('flowgraph', flow):
-        for index in chip.getkeys('flowgraph', flow, step):
-            flowgraph_edges[step, index] = set()
-            for in_step, in_index in chip.get('flowgraph', flow, step, index, 'input'):
-                flowgraph_edges[step, index].add((in_step, in_index))
+    for node, inputs in utils._get_flowgraph_values(chip, flow, 'input').items():
+        flowgraph_edges[node] = set()
+        for in_step, in_index in inputs:
+            flowgraph_edges[node].add((in_step, in_index))
     return flowgraph_edges
 
 
@@ -126,34 +127,22 @@ def make_manifest_helper(manifest_subsect, modified_manifest_subsect):
 
     if Schema._is_leaf(manifest_subsect):
         if manifest_subsect['pernode'] == 'never':
-            if 'global' in manifest_subsect['node']:
-                value = manifest_subsect['node']['global']['global']['value']
-            else:
-                value = manifest_subsect['node']['default']['default']['value']
-            modified_manifest_subsect['value'] = value
+            modified_manifest_subsect['value'] = build_leaf(manifest_subsect)
         else:
-            nodes = manifest_subsect['node']
-            for step in nodes:
-                if step == 'default' or step == 'global':
-                    value = nodes[step][step]['value']
-                    modified_manifest_subsect[step] = value
-                else:
-                    for index in nodes[step]:
-                        value = nodes[step][index]['value']
-                        if value is None:
-                            continue
-                        if index == 'default' or index == 'global':
-                            modified_manifest_subsect[step] = value
-                        else:
-                            modified_manifest_subsect[step + index] = value
-
-    for key, key_dict in manifest_subsect.items():
-        if key != 'default':
+            modified_manifest_subsect.update(build_leaf(manifest_subsect))
+
+    # walk the manifest with an explicit stack of (source, destination) pairs
+    to_search = [(manifest_subsect, modified_manifest_subsect)]
+    while to_search:
+        src, dst = to_search.pop()
+        for key, key_dict in src.items():
+            if key == 'default':
+                continue
             if Schema._is_leaf(key_dict):
-                modified_manifest_subsect[key] = build_leaf(key_dict)
+                dst[key] = build_leaf(key_dict)
             else:
-                modified_manifest_subsect[key] = {}
-                make_manifest_helper(key_dict, modified_manifest_subsect[key])
+                dst[key] = {}
+                to_search.append((key_dict, dst[key]))
 
 
 def make_manifest(chip):
@@ -188,28 +177,46 @@ def get_flowgraph_path(chip):
     return utils._get_flowgraph_path(chip, flow, chip.nodes_to_execute())
 
 
+def _prune_empty_subtrees(branches):
+    '''
+    Removes the branches that ended up empty after a manifest search.
+
+    Args:
+        branches (list) : A list of (parent, key) pairs in the order they were
+            created, so every branch comes after all of its ancestors.
+    '''
+    for parent, key in reversed(branches):
+        if not parent[key]:
+            del parent[key]
+
+
 def search_manifest_keys(manifest, key):
     '''
-    Function is a recursive helper to search_manifest, more info there.
+    Function is a helper to search_manifest, more info there.
 
     Args:
         manifest (dictionary) : A dictionary representing the manifest.
         key (string) : Searches all keys for partial matches on this string.
     '''
     filtered_manifest = {}
-    for dict_key in manifest:
-        if key in dict_key:
-            filtered_manifest[dict_key] = manifest[dict_key]
-        elif isinstance(manifest[dict_key], dict):
-            result = search_manifest_keys(manifest[dict_key], key)
-            if result:  # result is non-empty
-                filtered_manifest[dict_key] = result
+    branches = []
+    to_search = [(manifest, filtered_manifest)]
+    while to_search:
+        src, dst = to_search.pop()
+        for dict_key, value in src.items():
+            if key in dict_key:
+                dst[dict_key] = value
+            elif isinstance(value, dict):
+                dst[dict_key] = {}
+                branches.append((dst, dict_key))
+                to_search.append((value, dst[dict_key]))
+    _prune_empty_subtrees(branches)
     return filtered_manifest
 
 
 def search_manifest_values(manifest, value):
     '''
-    Function is a recursive helper to search_manifest, more info there.
+    Function is a helper to search_manifest, more info there.
 
     Args:
         manifest (dictionary) : A dicitionary representing the manifest.
@@ -217,13 +224,49 @@ def search_manifest_values(manifest, value):
             string.
     '''
     filtered_manifest = {}
-    for key in manifest:
-        if isinstance(manifest[key], dict):
-            result = search_manifest_values(manifest[key], value)
-            if result:  # result is non-empty
-                filtered_manifest[key] = result
-        elif isinstance(manifest[key], str) and value in manifest[key]:
-            filtered_manifest[key] = manifest[key]
+    branches = []
+    to_search = [(manifest, filtered_manifest)]
+    while to_search:
+        src, dst = to_search.pop()
+        for key, key_value in src.items():
+            if isinstance(key_value, dict):
+                dst[key] = {}
+                branches.append((dst, key))
+                to_search.append((key_value, dst[key]))
+            elif isinstance(key_value, str) and value in key_value:
+                dst[key] = key_value
+    _prune_empty_subtrees(branches)
+    return filtered_manifest
+
+
+def search_manifest_combined(manifest, key_search, value_search):
+    '''
+    Function is a helper to search_manifest, more info there. Filters by key
+    and value in a single pass, giving the same result as running
+    search_manifest_keys followed by search_manifest_values.
+
+    Args:
+        manifest (dictionary) : A dicitionary representing the manifest.
+        key_search (string) : Searches all keys for partial matches on this
+            string.
+        value_search (string) : Searches all values for partial matches on
+            this string.
+    '''
+    filtered_manifest = {}
+    branches = []
+    # key_found marks subtrees below a key match, where only values are checked
+    to_search = [(manifest, filtered_manifest, False)]
+    while to_search:
+        src, dst, key_found = to_search.pop()
+        for key, value in src.items():
+            key_match = key_found or key_search in key
+            if isinstance(value, dict):
+                dst[key] = {}
+                branches.append((dst, key))
+                to_search.append((value, dst[key], key_match))
+            elif key_match and isinstance(value, str) and value_search in value:
+                dst[key] = value
+    _prune_empty_subtrees(branches)
     return filtered_manifest
 
 
@@ -246,12 +289,13 @@ def search_manifest(manifest, key_search=None, value_search=None):
         least one key that contains the substring input and has values that
         contain v.
     '''
-    return_manifest = manifest
+    if key_search and value_search:
+        return search_manifest_combined(manifest, key_search, value_search)
     if key_search:
-        return_manifest = search_manifest_keys(return_manifest, key_search)
+        return search_manifest_keys(manifest, key_search)
     if value_search:
-        return_manifest = search_manifest_values(return_manifest, value_search)
-    return return_manifest
+        return search_manifest_values(manifest, value_search)
+    return manifest
 
 
 def get_total_manifest_key_count(manifest):
@@ -262,10 +306,12 @@ def get_total_manifest_key_count(manifest):
         manifest (dictionary) : A dicitionary representing the manifest.
         acc (int) : An accumulator of the current number of folders and files.
     '''
-    acc = len(manifest)
-    for dictKeys in manifest:
-        if isinstance(manifest[dictKeys], dict):
-            acc += get_total_manifest_key_count(manifest[dictKeys])
+    acc = 0
+    to_count = collections.deque([manifest])
+    while to_count:
+        subsect = to_count.pop()
+        acc += len(subsect)
+        to_count.extend(value for value in subsect.values() if isinstance(value, dict))
     return acc
 
 
@@ -305,13 +351,8 @@ def get_files(chip, step, index):
         step (string) : Step of node.
         index (string) : Index of node.
     '''
-    # could combine filters, but slightly more efficient to separate them
-    # Is remaking the list with sets instead of list worth it?
-    logs_and_reports = []
-    all_paths = os.walk(chip._getworkdir(step=step, index=index))
-    for path_name, folders, files in all_paths:
-        logs_and_reports.append((path_name, set(folders), set(files)))
-    return logs_and_reports
+    return [(path_name, set(folders), set(files))
+            for path_name, folders, files in os.walk(chip._getworkdir(step=step, index=index))]
 
 
 def get_chart_data(chips, metric, nodes):
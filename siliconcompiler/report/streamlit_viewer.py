@@ -377,12 +377,10 @@ def manifest_module(chip, manifest, ui_width, max_num_of_keys_to_show=20,
     # search
     with key_search_col:
         key = streamlit.text_input('Search Keys', '', placeholder="Keys")
-        if key != '':
-            manifest_to_show = report.search_manifest(manifest_to_show, key_search=key)
     with value_search_col:
         value = streamlit.text_input('Search Values', '', placeholder="Values")
-        if value != '':
-            manifest_to_show = report.search_manifest(manifest_to_show, value_search=value)
+    manifest_to_show = report.search_manifest(manifest_to_show, key_search=key,
+                                              value_search=value)
     with download_col:
         streamlit.markdown(' ')  # aligns download button with title
         streamlit.download_button(label='Download manifest', file_name='manifest.json',
@@ -1,4 +1,6 @@
+import collections
 from siliconcompiler import NodeStatus
+from siliconcompiler.schema import Schema
 from siliconcompiler import units
 
 
@@ -10,17 +12,40 @@ def _find_summary_image(chip, ext='png'):
     return None
 
 
+def _get_flowgraph_values(chip, flow, param):
+    '''
+    Returns a dictionary mapping each (step, index) node in the flow to the
+    value of the flowgraph parameter param. The values are read in one sweep
+    over the schema dictionary, falling back to chip.get if a node does not
+    have the expected layout.
+    '''
+    values = {}
+    flow_cfg = chip.schema.cfg['flowgraph'].get(flow, {})
+    for step, step_cfg in flow_cfg.items():
+        if step == 'default':
+            continue
+        for index, node_cfg in step_cfg.items():
+            if index == 'default':
+                continue
+            try:
+                param_nodes = node_cfg[param]['node']
+                if Schema.GLOBAL_KEY in param_nodes:
+                    value = param_nodes[Schema.GLOBAL_KEY][Schema.GLOBAL_KEY]['value']
+                else:
+                    value = param_nodes['default']['default']['value']
+            except (KeyError, TypeError):
+                value = chip.get('flowgraph', flow, step, index, param)
+            values[step, index] = value
+    return values
+
+
 def _collect_data(chip, flow=None, flowgraph_nodes=None, format_as_string=True):
     if not flow:
         flow = chip.get('option', 'flow')
     if not flowgraph_nodes:
-        flowgraph_nodes = chip.nodes_to_execute()
         # only report tool based steps functions
-        for (step, index) in flowgraph_nodes.copy():
-            tool, task = chip._get_tool_task(step, '0', flow=flow)
-            if chip._is_builtin(tool, task):
-                index = flowgraph_nodes.index((step, index))
-                del flowgraph_nodes[index]
+        flowgraph_nodes = [(step, index) for step, index in chip.nodes_to_execute()
+                           if not chip._is_builtin(*chip._get_tool_task(step, '0', flow=flow))]
 
     # Collections for data
     nodes = []
@@ -32,10 +57,19 @@ def _collect_data(chip, flow=None, flowgraph_nodes=None, format_as_string=True):
     # Build ordered list of nodes in flowgraph
     for level_nodes in chip._get_flowgraph_execution_order(flow):
         nodes.extend(sorted(level_nodes))
+    flowgraph_nodes = set(flowgraph_nodes)
     nodes = [node for node in nodes if node in flowgraph_nodes]
+
+    # Lookups that only depend on the node are done once up front
+    node_tool_task = {}
+    node_weights = {}
     for (step, index) in nodes:
         metrics[step, index] = {}
         reports[step, index] = {}
+        node_tool_task[step, index] = chip._get_tool_task(step, index, flow=flow)
+        node_weights[step, index] = set(chip.getkeys('flowgraph', flow, step, index, 'weight'))
+        errors[step, index] = chip.get('flowgraph', flow, step, index, 'status') == \
+            NodeStatus.ERROR
 
     # Gather data and determine which metrics to show
     # We show a metric if:
@@ -43,43 +77,46 @@ def _collect_data(chip, flow=None, flowgraph_nodes=None, format_as_string=True):
     # - at least one step in the steps has a non-zero weight for the metric -OR -
     #   at least one step in the steps set a value for it
     metrics_to_show = []
+    metricoff = set(chip.get('option', 'metricoff'))
     for metric in chip.getkeys('metric'):
-        if metric in chip.get('option', 'metricoff'):
+        if metric in metricoff:
             continue
 
-        # Get the unit associated with the metric
-        metric_unit = None
-        if chip.schema._has_field('metric', metric, 'unit'):
-            metric_unit = chip.get('metric', metric, field='unit')
-        metric_type = chip.get('metric', metric, field='type')
-
+        # Decide whether to show the metric before formatting any values
+        values = {}
         show_metric = False
         for step, index in nodes:
-            if metric in chip.getkeys('flowgraph', flow,
-                                      step, index, 'weight') and \
-               chip.get('flowgraph', flow, step, index, 'weight', metric):
-                show_metric = True
-
             value = chip.get('metric', metric, step=step, index=index)
+            values[step, index] = value
             if value is not None:
                 show_metric = True
-            tool, task = chip._get_tool_task(step, index, flow=flow)
-            rpts = chip.get('tool', tool, 'task', task, 'report', metric,
-                            step=step, index=index)
+            elif metric in node_weights[step, index] and \
+                    chip.get('flowgraph', flow, step, index, 'weight', metric):
+                show_metric = True
 
-            errors[step, index] = chip.get('flowgraph', flow,
-                                           step, index, 'status') == \
-                NodeStatus.ERROR
+        if not show_metric:
+            for node in nodes:
+                metrics[node][metric] = None
+            continue
+
+        # Get the unit associated with the metric
+        metric_unit = None
+        if chip.schema._has_field('metric', metric, 'unit'):
+            metric_unit = chip.get('metric', metric, field='unit')
+        metric_type = chip.get('metric', metric, field='type')
 
+        for step, index in nodes:
+            value = values[step, index]
             if value is not None:
                 value = _format_value(metric, value, metric_unit, metric_type, format_as_string)
+            tool, task = node_tool_task[step, index]
 
             metrics[step, index][metric] = value
-            reports[step, index][metric] = rpts
+            reports[step, index][metric] = chip.get('tool', tool, 'task', task, 'report', metric,
+                                                    step=step, index=index)
 
-        if show_metric:
-            metrics_to_show.append(metric)
-            metrics_unit[metric] = metric_unit if metric_unit else ''
+        metrics_to_show.append(metric)
+        metrics_unit[metric] = metric_unit if metric_unit else ''
 
     return nodes, errors, metrics, metrics_unit, metrics_to_show, reports
 
@@ -104,7 +141,7 @@ def _format_value(metric, value, metric_unit, metric_type, format_as_string):
 
 def _get_flowgraph_path(chip, flow, nodes_to_execute, only_include_successful=False):
     selected_nodes = set()
-    to_search = []
+    to_search = collections.deque()
     # Start search with any successful leaf nodes.
     flowgraph_steps = list(map(lambda node: node[0], nodes_to_execute))
     end_nodes = chip._get_flowgraph_exit_nodes(flow, steps=flowgraph_steps)
@@ -118,10 +155,10 @@ def _get_flowgraph_path(chip, flow, nodes_to_execute, only_include_successful=Fa
             selected_nodes.add(node)
             to_search.append(node)
     # Search backwards, saving anything that was selected by leaf nodes.
-    while len(to_search) > 0:
-        node = to_search.pop(-1)
-        input_nodes = chip.get('flowgraph', flow, *node, 'select')
-        for selected in input_nodes:
+    node_selects = _get_flowgraph_values(chip, flow, 'select')
+    while to_search:
+        node = to_search.pop()
+        for selected in node_selects.get(node, ()):
             if selected not in selected_nodes:
                 selected_nodes.add(selected)
                 to_search.append(selected)
@@ -18,6 +18,12 @@ from siliconcompiler import sc_open
 from siliconcompiler import utils
 from siliconcompiler.tools._common_asic import get_mainlib, set_tool_task_var
 
+try:
+    import orjson
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
 
 ####################################################################
 # Make Docs
@@ -48,6 +54,29 @@ def setup_tool(chip, exit=True, clobber=True):
     chip.set('tool', tool, 'task', task, 'option', option, step=step, index=index, clobber=clobber)
 
 
+def _get_available_cpus():
+    # only count the cpus this process is allowed to run on, ie. when limited by
+    # a container or scheduler, falling back to all cpus where that is unsupported
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# (cell, port) library variables which must be set together
+_OR_TIE_VARS = (
+    ('openroad_tiehigh_cell', 'openroad_tiehigh_port'),
+    ('openroad_tielow_cell', 'openroad_tielow_port')
+)
+
+# pdk openroad variables required per stackup
+_OR_PDK_REQUIRED_VARS = (
+    'rclayer_signal',
+    'rclayer_clock',
+    'pin_layer_horizontal',
+    'pin_layer_vertical'
+)
+
+
 def setup(chip):
 
     # default tool settings, note, not additive!
@@ -70,6 +99,10 @@ def setup(chip):
     delaymodel = chip.get('asic', 'delaymodel', step=step, index=index)
     libtype = chip.get('library', mainlib, 'asic', 'libarch', step=step, index=index)
 
+    if delaymodel != 'nldm':
+        chip.error(f'{delaymodel} delay model is not supported by {tool}, only nldm')
+        return
+
     is_screenshot = task == 'screenshot'
     is_show_screenshot = task == 'show' or is_screenshot
 
@@ -82,10 +115,10 @@ def setup(chip):
     setup_tool(chip, exit=task != 'show', clobber=clobber)
 
     # normalizing thread count based on parallelism and local
-    threads = os.cpu_count()
+    threads = _get_available_cpus()
     if not chip.get('option', 'remote') and step in chip.getkeys('flowgraph', flow):
         np = len(chip.getkeys('flowgraph', flow, step))
-        threads = int(math.ceil(os.cpu_count() / np))
+        threads = max(1, int(math.ceil(threads / np)))
 
     # Input/Output requirements for default asicflow steps
 
@@ -107,59 +140,46 @@ def setup(chip):
         chip.set('tool', tool, 'task', task, 'env', 'QT_QPA_PLATFORM', 'offscreen',
                  step=step, index=index)
 
-    if delaymodel != 'nldm':
-        chip.logger.error(f'{delaymodel} delay model is not supported by {tool}, only nldm')
-
     if stackup and targetlibs:
         # Note: only one footprint supported in mainlib
         chip.add('tool', tool, 'task', task, 'require',
-                 ",".join(['asic', 'logiclib']),
-                 step=step, index=index)
-        chip.add('tool', tool, 'task', task, 'require',
-                 ",".join(['option', 'stackup']),
-                 step=step, index=index)
-        chip.add('tool', tool, 'task', task, 'require',
-                 ",".join(['library', mainlib, 'asic', 'site', libtype]),
-                 step=step, index=index)
-        chip.add('tool', tool, 'task', task, 'require',
-                 ",".join(['pdk', pdkname, 'aprtech', 'openroad', stackup, libtype, 'lef']),
+                 [",".join(['asic', 'logiclib']),
+                  ",".join(['option', 'stackup']),
+                  ",".join(['library', mainlib, 'asic', 'site', libtype]),
+                  ",".join(['pdk', pdkname, 'aprtech', 'openroad', stackup, libtype, 'lef'])],
                  step=step, index=index)
 
+        timing_constraints = _get_timing_constraints(chip)
+        lib_requires = []
         for lib in targetlibs:
-            for timing_key in get_library_timing_keypaths(chip, lib).values():
-                chip.add('tool', tool, 'task', task, 'require', ",".join(timing_key),
-                         step=step, index=index)
-            chip.add('tool', tool, 'task', task, 'require',
-                     ",".join(['library', lib, 'output', stackup, 'lef']),
-                     step=step, index=index)
+            for timing_key in get_library_timing_keypaths(
+                    chip, lib, constraints=timing_constraints).values():
+                lib_requires.append(",".join(timing_key))
+            lib_requires.append(",".join(['library', lib, 'output', stackup, 'lef']))
         for lib in macrolibs:
-            for timing_key in get_library_timing_keypaths(chip, lib).values():
+            for timing_key in get_library_timing_keypaths(
+                    chip, lib, constraints=timing_constraints).values():
                 if chip.valid(*timing_key):
-                    chip.add('tool', tool, 'task', task, 'require', ",".join(timing_key),
-                             step=step, index=index)
-            chip.add('tool', tool, 'task', task, 'require',
-                     ",".join(['library', lib, 'output', stackup, 'lef']),
-                     step=step, index=index)
+                    lib_requires.append(",".join(timing_key))
+            lib_requires.append(",".join(['library', lib, 'output', stackup, 'lef']))
+        chip.add('tool', tool, 'task', task, 'require', lib_requires,
+                 step=step, index=index)
     else:
         chip.error('Stackup and logiclib parameters required for OpenROAD.')
 
     # Set required keys
-    for var0, var1 in [('openroad_tiehigh_cell', 'openroad_tiehigh_port'),
-                       ('openroad_tiehigh_cell', 'openroad_tiehigh_port')]:
-        key0 = ['library', mainlib, 'option', 'var', tool, var0]
-        key1 = ['library', mainlib, 'option', 'var', tool, var1]
+    for var0, var1 in _OR_TIE_VARS:
+        key0 = ['library', mainlib, 'option', 'var', var0]
+        key1 = ['library', mainlib, 'option', 'var', var1]
         if chip.valid(*key0):
             chip.add('tool', tool, 'task', task, 'require', ",".join(key1), step=step, index=index)
         if chip.valid(*key1):
             chip.add('tool', tool, 'task', task, 'require', ",".join(key0), step=step, index=index)
 
-    for key in (['pdk', pdkname, 'var', 'openroad', 'rclayer_signal', stackup],
-                ['pdk', pdkname, 'var', 'openroad', 'rclayer_clock', stackup],
-                ['pdk', pdkname, 'var', 'openroad', 'pin_layer_horizontal', stackup],
-                ['pdk', pdkname, 'var', 'openroad', 'pin_layer_vertical', stackup]):
-        chip.add('tool', tool, 'task', task, 'require',
-                 ",".join(key),
-                 step=step, index=index)
+    chip.add('tool', tool, 'task', task, 'require',
+             [",".join(['pdk', pdkname, 'var', 'openroad', var, stackup])
+              for var in _OR_PDK_REQUIRED_VARS],
+             step=step, index=index)
 
     # set default values for openroad
     _define_ord_params(chip)
@@ -216,6 +236,13 @@ def normalize_version(version):
         return '0'
 
 
+# (library file, openroad file) copied from the libraries when not set
+_OR_LIB_FILES = (
+    ('openroad_pdngen', 'pdn_config'),
+    ('openroad_global_connect', 'global_connect')
+)
+
+
 def pre_process(chip):
     step = chip.get('arg', 'step')
     index = chip.get('arg', 'index')
@@ -237,8 +264,7 @@ def pre_process(chip):
         chip.set('tool', tool, 'task', task, 'file', 'ifp_tapcell', tapfile,
                  step=step, index=index, clobber=False)
 
-    for libvar, openroadvar in [('openroad_pdngen', 'pdn_config'),
-                                ('openroad_global_connect', 'global_connect')]:
+    for libvar, openroadvar in _OR_LIB_FILES:
         if chip.valid('tool', tool, 'task', task, 'file', openroadvar) and \
            chip.get('tool', tool, 'task', task, 'file', openroadvar, step=step, index=index):
             # value already set
@@ -255,6 +281,54 @@ def pre_process(chip):
 ################################
 # Post_process (post executable)
 ################################
+# (unit, openroad unit metric)
+_OR_UNITS = (
+    ('time', 'run__flow__platform__time_units'),
+    ('capacitance', 'run__flow__platform__capacitance_units'),
+    ('resistance', 'run__flow__platform__resistance_units'),
+    ('volt', 'run__flow__platform__voltage_units'),
+    ('amp', 'run__flow__platform__current_units'),
+    ('power', 'run__flow__platform__power_units'),
+    ('distance', 'run__flow__platform__distance_units')
+)
+
+# (metric, openroad metric, requires timing, unit or scale factor)
+_OR_METRICS = (
+    ('vias', 'sc__step__route__vias', False, None),
+    ('wirelength', 'sc__step__route__wirelength', False, 'distance'),
+    ('cellarea', 'sc__metric__design__instance__area', False, 'area'),
+    ('totalarea', 'sc__metric__design__core__area', False, 'area'),
+    ('utilization', 'sc__metric__design__instance__utilization', False, 100.0),
+    ('setuptns', 'sc__metric__timing__setup__tns', True, 'time'),
+    ('holdtns', 'sc__metric__timing__hold__tns', True, 'time'),
+    ('setupslack', 'sc__metric__timing__setup__ws', True, 'time'),
+    ('holdslack', 'sc__metric__timing__hold__ws', True, 'time'),
+    ('fmax', 'sc__metric__timing__fmax', True, 'frequency'),
+    ('setuppaths', 'sc__metric__timing__drv__setup_violation_count', False, None),
+    ('holdpaths', 'sc__metric__timing__drv__hold_violation_count', False, None),
+    ('unconstrained', 'sc__metric__timing__unconstrained', False, None),
+    ('peakpower', 'sc__metric__power__total', False, 'power'),
+    ('leakagepower', 'sc__metric__power__leakage__total', False, 'power'),
+    ('pins', 'sc__metric__design__io', False, None),
+    ('cells', 'sc__metric__design__instance__count', False, None),
+    ('macros', 'sc__metric__design__instance__count__macros', False, None),
+    ('nets', 'sc__metric__design__nets', False, None),
+    ('registers', 'sc__metric__design__registers', False, None),
+    ('buffers', 'sc__metric__design__buffers', False, None),
+    ('logicdepth', 'sc__metric__design__logic__depth', False, None)
+)
+
+# openroad metrics which are summed into drvs
+_OR_DRV_METRICS = (
+    'sc__metric__timing__drv__max_slew',
+    'sc__metric__timing__drv__max_cap',
+    'sc__metric__timing__drv__max_fanout',
+    'sc__step__route__drc_errors',
+    'sc__metric__antenna__violating__nets',
+    'sc__metric__antenna__violating__pins'
+)
+
+
 def post_process(chip):
     ''' Tool specific function to run after step execution
     '''
@@ -296,19 +370,13 @@ def post_process(chip):
     # parsing log file
     with sc_open(metrics_file) as f:
         try:
-            metrics = json.load(f)
+            metrics = _load_json(f.read())
         except json.decoder.JSONDecodeError as e:
             chip.logger.error(f'Unable to parse metrics from OpenROAD: {e}')
             metrics = {}
 
         or_units = {}
-        for unit, or_unit in [('time', 'run__flow__platform__time_units'),
-                              ('capacitance', 'run__flow__platform__capacitance_units'),
-                              ('resistance', 'run__flow__platform__resistance_units'),
-                              ('volt', 'run__flow__platform__voltage_units'),
-                              ('amp', 'run__flow__platform__current_units'),
-                              ('power', 'run__flow__platform__power_units'),
-                              ('distance', 'run__flow__platform__distance_units')]:
+        for unit, or_unit in _OR_UNITS:
             if or_unit in metrics:
                 # Remove first digit
                 metric_unit = metrics[or_unit][1:]
@@ -323,32 +391,10 @@ def post_process(chip):
         if 'sc__metric__timing__clocks' in metrics:
             has_timing = metrics['sc__metric__timing__clocks'] > 0
 
-        for metric, or_metric, or_use, or_unit in [
-            ('vias', 'sc__step__route__vias', True, None),
-            ('wirelength', 'sc__step__route__wirelength', True, 'distance'),
-            ('cellarea', 'sc__metric__design__instance__area', True, 'area'),
-            ('totalarea', 'sc__metric__design__core__area', True, 'area'),
-            ('utilization', 'sc__metric__design__instance__utilization', True, 100.0),
-            ('setuptns', 'sc__metric__timing__setup__tns', has_timing, 'time'),
-            ('holdtns', 'sc__metric__timing__hold__tns', has_timing, 'time'),
-            ('setupslack', 'sc__metric__timing__setup__ws', has_timing, 'time'),
-            ('holdslack', 'sc__metric__timing__hold__ws', has_timing, 'time'),
-            ('fmax', 'sc__metric__timing__fmax', has_timing, 'frequency'),
-            ('setuppaths', 'sc__metric__timing__drv__setup_violation_count', True, None),
-            ('holdpaths', 'sc__metric__timing__drv__hold_violation_count', True, None),
-            ('unconstrained', 'sc__metric__timing__unconstrained', True, None),
-            ('peakpower', 'sc__metric__power__total', True, 'power'),
-            ('leakagepower', 'sc__metric__power__leakage__total', True, 'power'),
-            ('pins', 'sc__metric__design__io', True, None),
-            ('cells', 'sc__metric__design__instance__count', True, None),
-            ('macros', 'sc__metric__design__instance__count__macros', True, None),
-            ('nets', 'sc__metric__design__nets', True, None),
-            ('registers', 'sc__metric__design__registers', True, None),
-            ('buffers', 'sc__metric__design__buffers', True, None),
-            ('logicdepth', 'sc__metric__design__logic__depth', True, None)
-        ]:
+        for metric, or_metric, is_timing, or_unit in _OR_METRICS:
             if or_metric in metrics:
                 value = metrics[or_metric]
+                or_use = has_timing or not is_timing
 
                 # Check for INF timing
                 if or_unit == 'time' and abs(value) > 1e24:
@@ -398,32 +444,50 @@ def post_process(chip):
                                 get_metric_sources('holdslack'),
                                 source_unit=wns_units)
 
-        drvs = None
-        for metric in ['sc__metric__timing__drv__max_slew',
-                       'sc__metric__timing__drv__max_cap',
-                       'sc__metric__timing__drv__max_fanout',
-                       'sc__step__route__drc_errors',
-                       'sc__metric__antenna__violating__nets',
-                       'sc__metric__antenna__violating__pins']:
-            if metric in metrics:
-                if drvs is None:
-                    drvs = int(metrics[metric])
-                else:
-                    drvs += int(metrics[metric])
+        drvs = [int(metrics[metric]) for metric in _OR_DRV_METRICS if metric in metrics]
+        if drvs:
+            chip._record_metric(step, index, 'drvs', sum(drvs), get_metric_sources('drv'))
 
-        if drvs is not None:
-            chip._record_metric(step, index, 'drvs', drvs, get_metric_sources('drv'))
+
+def _load_json(content):
+    if _has_orjson:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson does not accept NaN or Infinity, so let json decide
+            pass
+    return json.loads(content)
 
 
 ######
-def get_library_timing_keypaths(chip, lib):
+def _get_timing_constraints(chip):
+    '''
+    Returns a list of (constraint, libcorner, pexcorner, check) for every
+    timing constraint in the current step and index.
+    '''
     step = chip.get('arg', 'step')
     index = chip.get('arg', 'index')
 
+    constraints = []
+    for constraint in chip.getkeys('constraint', 'timing'):
+        constraints.append((
+            constraint,
+            chip.get('constraint', 'timing', constraint, 'libcorner', step=step, index=index),
+            chip.get('constraint', 'timing', constraint, 'pexcorner', step=step, index=index),
+            chip.get('constraint', 'timing', constraint, 'check', step=step, index=index)))
+    return constraints
+
+
+def get_library_timing_keypaths(chip, lib, constraints=None):
+    step = chip.get('arg', 'step')
+    index = chip.get('arg', 'index')
+
+    if constraints is None:
+        constraints = _get_timing_constraints(chip)
+
     delaymodel = chip.get('asic', 'delaymodel', step=step, index=index)
     keypaths = {}
-    for constraint in chip.getkeys('constraint', 'timing'):
-        corners = chip.get('constraint', 'timing', constraint, 'libcorner', step=step, index=index)
+    for constraint, corners, _, _ in constraints:
         for corner in corners:
             if chip.valid('library', lib, 'output', corner, delaymodel):
                 keypaths[constraint] = ('library', lib, 'output', corner, delaymodel)
@@ -433,40 +497,37 @@ def get_library_timing_keypaths(chip, lib):
     return keypaths
 
 
-def get_pex_corners(chip):
-
-    step = chip.get('arg', 'step')
-    index = chip.get('arg', 'index')
+def get_pex_corners(chip, constraints=None):
+    if constraints is None:
+        constraints = _get_timing_constraints(chip)
 
     corners = set()
-    for constraint in chip.getkeys('constraint', 'timing'):
-        pexcorner = chip.get('constraint', 'timing', constraint, 'pexcorner',
-                             step=step, index=index)
+    for _, _, pexcorner, _ in constraints:
         if pexcorner:
             corners.add(pexcorner)
 
-    return list(corners)
+    # sorted to keep the generated manifest stable between runs
+    return sorted(corners)
 
 
-def get_constraint_by_check(chip, check):
-    step = chip.get('arg', 'step')
-    index = chip.get('arg', 'index')
+def get_constraint_by_check(chip, check, constraints=None):
+    if constraints is None:
+        constraints = _get_timing_constraints(chip)
 
-    for constraint in chip.getkeys('constraint', 'timing'):
-        if check in chip.get('constraint', 'timing', constraint, 'check',
-                             step=step, index=index):
+    for constraint, _, _, checks in constraints:
+        if check in checks:
             return constraint
 
     # if not specified, just pick the first constraint available
-    return chip.getkeys('constraint', 'timing')[0]
+    return constraints[0][0]
 
 
-def get_power_corner(chip):
-    return get_constraint_by_check(chip, "power")
+def get_power_corner(chip, constraints=None):
+    return get_constraint_by_check(chip, "power", constraints=constraints)
 
 
-def get_setup_corner(chip):
-    return get_constraint_by_check(chip, "setup")
+def get_setup_corner(chip, constraints=None):
+    return get_constraint_by_check(chip, "setup", constraints=constraints)
 
 
 def build_pex_corners(chip):
@@ -477,52 +538,58 @@ def build_pex_corners(chip):
     pdkname = chip.get('option', 'pdk')
     stackup = chip.get('option', 'stackup')
 
-    corners = {}
-    for constraint in chip.getkeys('constraint', 'timing'):
-        pexcorner = chip.get('constraint', 'timing', constraint, 'pexcorner',
-                             step=step, index=index)
+    constraints = _get_timing_constraints(chip)
 
+    corners = {}
+    for constraint, _, pexcorner, _ in constraints:
         if not pexcorner:
             continue
         corners[constraint] = pexcorner
 
-    default_corner = get_setup_corner(chip)
+    default_corner = get_setup_corner(chip, constraints=constraints)
     if default_corner in corners:
         corners[None] = corners[default_corner]
 
+    pex_template = utils.get_file_template('pex.tcl',
+                                           root=os.path.join(os.path.dirname(__file__),
+                                                             'templates'))
+    # corners frequently share a source file, so only load each template once
+    corner_pex_templates = {}
+
+    pex_sections = []
+    for constraint, pexcorner in corners.items():
+        if chip.valid('pdk', pdkname, 'pexmodel', tool, stackup, pexcorner):
+            pex_source_files = chip.find_files('pdk', pdkname,
+                                               'pexmodel',
+                                               tool,
+                                               stackup,
+                                               pexcorner)
+            if not pex_source_files or not pex_source_files[0]:
+                continue
+            pex_source_file = pex_source_files[0]
+
+            if pex_source_file not in corner_pex_templates:
+                corner_pex_templates[pex_source_file] = \
+                    utils.get_file_template(pex_source_file)
+            corner_pex_template = corner_pex_templates[pex_source_file]
+
+            if constraint is None:
+                constraint = "default"
+                corner_specification = ""
+            else:
+                corner_specification = f"-corner {constraint}"
+
+            pex_sections.append(pex_template.render(
+                constraint=constraint,
+                pexcorner=pexcorner,
+                source=pex_source_file,
+                pex=corner_pex_template.render({"corner": corner_specification})
+            ))
+            pex_sections.append('\n')
+
     with open(chip.get('tool', tool, 'task', task, 'file', 'parasitics',
                        step=step, index=index)[0], 'w') as f:
-        for constraint, pexcorner in corners.items():
-            if chip.valid('pdk', pdkname, 'pexmodel', tool, stackup, pexcorner):
-                pex_source_file = chip.find_files('pdk', pdkname,
-                                                  'pexmodel',
-                                                  tool,
-                                                  stackup,
-                                                  pexcorner)[0]
-                if not pex_source_file:
-                    continue
-
-                corner_pex_template = utils.get_file_template(pex_source_file)
-                pex_template = utils.get_file_template('pex.tcl',
-                                                       root=os.path.join(os.path.dirname(__file__),
-                                                                         'templates'))
-
-                if not pex_template:
-                    continue
-
-                if constraint is None:
-                    constraint = "default"
-                    corner_specification = ""
-                else:
-                    corner_specification = f"-corner {constraint}"
-
-                f.write(pex_template.render(
-                    constraint=constraint,
-                    pexcorner=pexcorner,
-                    source=pex_source_file,
-                    pex=corner_pex_template.render({"corner": corner_specification})
-                ))
-                f.write('\n')
+        f.writelines(pex_sections)
 
 
 def _define_ifp_params(chip):
@@ -104,7 +104,7 @@ def setup_asic(chip):
                  step=step, index=index)
 
     for var0, var1 in [('yosys_tiehigh_cell', 'yosys_tiehigh_port'),
-                       ('yosys_tiehigh_cell', 'yosys_tiehigh_port')]:
+                       ('yosys_tielow_cell', 'yosys_tielow_port')]:
         key0 = ['library', mainlib, 'option', 'var', var0]
         key1 = ['library', mainlib, 'option', 'var', var1]
         if chip.valid(*key0):
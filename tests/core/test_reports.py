@@ -6,6 +6,24 @@ import os
 from pathlib import Path
 
 
+def test_make_metric_dataframe():
+    '''
+    Ensures make_metric_dataframe has one column per node and one row per
+    tracked metric, with rows labeled by (metric, unit).
+    '''
+    chip = Chip(design='test')
+    chip.load_target(freepdk45_demo)
+    chip.set('metric', 'cells', 10, step='syn', index='0')
+    chip.set('metric', 'totalarea', 12.5, step='place', index='0')
+
+    data = report.make_metric_dataframe(chip)
+
+    assert ('syn', '0') in data.columns
+    assert data.loc[('cells', ''), ('syn', '0')] == '10'
+    assert data.loc[('totalarea', 'um^2'), ('place', '0')] == '12.500'
+    assert data.loc[('cells', ''), ('place', '0')] is None
+
+
 def test_get_flowgraph_nodes():
     '''
     this ensures that get_flowgraph_nodes correctly records the parts of the
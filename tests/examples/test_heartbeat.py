@@ -19,6 +19,15 @@ def test_sim():
     heartbeat_sim.main()
 
 
+@pytest.mark.eda
+def test_sim_parallel():
+    from heartbeat import heartbeat_sim
+    heartbeat_sim.main(n=2)
+
+    for index in ('0', '1'):
+        assert os.path.isdir(f'build/heartbeat/job0/sim/{index}')
+
+
 @pytest.mark.eda
 @pytest.mark.quick
 @pytest.mark.timeout(300)
@@ -4,6 +4,7 @@ import siliconcompiler
 import pytest
 
 from siliconcompiler.tools.openroad import floorplan
+from siliconcompiler.tools.openroad import openroad
 
 from siliconcompiler.tools.builtin import nop
 
@@ -68,6 +69,27 @@ def test_openroad_images(scroot):
                                        f'{chip.design}.png'))
 
 
+def test_build_pex_corners_missing_pexmodel():
+    chip = siliconcompiler.Chip('test')
+    chip.load_target("skywater130_demo")
+
+    stackup = chip.get('option', 'stackup')
+    for corner in chip.getkeys('pdk', 'skywater130', 'pexmodel', 'openroad', stackup):
+        chip.set('pdk', 'skywater130', 'pexmodel', 'openroad', stackup, corner, [])
+
+    chip.set('arg', 'step', 'place')
+    chip.set('arg', 'index', '0')
+    openroad.setup(chip)
+
+    parasitics = chip.get('tool', 'openroad', 'task', 'place', 'file', 'parasitics',
+                          step='place', index='0')[0]
+    os.makedirs(os.path.dirname(parasitics))
+    openroad.build_pex_corners(chip)
+
+    with open(parasitics) as f:
+        assert f.read() == ''
+
+
 #########################
 if __name__ == "__main__":
     from tests.fixtures import scroot